@@ -31,6 +31,7 @@ const SEC_LEVELS = ["NULLSEC", "LOWSEC", "MIDSEC", "HIGHSEC", "FULLSEC"];
 const DRIVE_MAX_CAP_BYTES = 4_000_000;
 // Hackmud-like corruption glyph for "missing" characters in the signal.
 const GLITCH_GLYPH = "█";
+const GLITCH_GLYPH_RE = new RegExp(GLITCH_GLYPH, "g");
 const MESH_BRIDGE_FLAG = "mesh_bridge_done";
 const PRIMER_PAYLOAD = "DRIFTLOCAL::SEED=7|11|23|5|13|2";
 const TRAINING_WORD = "WELCOME";
@@ -85,10 +86,10 @@ const NARRATIVE_STEPS = [
   },
 ];
 const GLITCH_FRAGMENTS = {
-  alpha: { id: "alpha", clue: "FRACTURE", desc: "A sliver that says the drift cracked first." },
-  beta: { id: "beta", clue: "MIRROR", desc: "A reflection that does not match the caller." },
-  gamma: { id: "gamma", clue: "EMBER", desc: "A spark that keeps burning inside signal noise." },
-  delta: { id: "delta", clue: "STILL", desc: "The reminder to slow down when trace rises." },
+  alpha: { id: "alpha", flag: "fragment_alpha", clue: "FRACTURE", desc: "A sliver that says the drift cracked first." },
+  beta: { id: "beta", flag: "fragment_beta", clue: "MIRROR", desc: "A reflection that does not match the caller." },
+  gamma: { id: "gamma", flag: "fragment_gamma", clue: "EMBER", desc: "A spark that keeps burning inside signal noise." },
+  delta: { id: "delta", flag: "fragment_delta", clue: "STILL", desc: "The reminder to slow down when trace rises." },
 };
 const GLITCH_FRAGMENT_IDS = Object.keys(GLITCH_FRAGMENTS);
 const NARRATIVE_CUES = {
@@ -537,6 +538,7 @@ const localFolderForget = document.getElementById("local-folder-forget");
 let saveDirty = false;
 let autosaveTimer = null;
 let autosaveInterval = null;
+let autosaveIdlePending = false;
 let lastAutosaveAt = 0;
 let siphonInterval = null;
 let booting = false;
@@ -765,7 +767,7 @@ function scheduleAutosave() {
   if (autosaveTimer) return;
   autosaveTimer = window.setTimeout(() => {
     autosaveTimer = null;
-    autoSaveNow();
+    autoSaveWhenIdle();
   }, 3000);
 }
 
@@ -782,9 +784,27 @@ function autoSaveNow() {
   lastAutosaveAt = now;
 }
 
+function autoSaveWhenIdle() {
+  // Serializing + writing localStorage is synchronous; push background saves to idle time
+  // so they don't land between a keypress and the command's output.
+  if (autosaveIdlePending) return;
+  if (typeof window.requestIdleCallback !== "function") {
+    autoSaveNow();
+    return;
+  }
+  autosaveIdlePending = true;
+  window.requestIdleCallback(
+    () => {
+      autosaveIdlePending = false;
+      autoSaveNow();
+    },
+    { timeout: 2000 }
+  );
+}
+
 function ensureAutosaveLoop() {
   if (autosaveInterval) return;
-  autosaveInterval = window.setInterval(() => autoSaveNow(), 5000);
+  autosaveInterval = window.setInterval(() => autoSaveWhenIdle(), 5000);
   window.addEventListener("beforeunload", () => {
     try {
       saveState({ silent: true });
@@ -1784,13 +1804,25 @@ function writeLine(text, kind) {
 }
 
 function writeBlock(text, kind) {
-  if (!text) {
+  // Accepts a string or a pre-split array of lines (static LOCS text is split once and reused).
+  if (!text || (Array.isArray(text) && !text.length)) {
     writeLine("", kind);
     return;
   }
-  String(text)
-    .split("\n")
-    .forEach((line) => writeLine(line, kind));
+  const lines = Array.isArray(text) ? text : String(text).split("\n");
+  lines.forEach((line) => writeLine(line, kind));
+}
+
+const staticBlockLinesCache = new WeakMap();
+function staticBlockLines(entry) {
+  // LOCS file entries never change, so split their content once per entry.
+  if (!entry || !entry.content) return "";
+  let lines = staticBlockLinesCache.get(entry);
+  if (!lines) {
+    lines = String(entry.content).split("\n");
+    staticBlockLinesCache.set(entry, lines);
+  }
+  return lines;
 }
 
 function writeLineWithChips(prefixText, commands, kind) {
@@ -2006,11 +2038,48 @@ function getKnownNamesRegex() {
   return knownNamesCacheRegex;
 }
 
+const RICH_SEGMENT_CACHE_MAX = 256;
+const richSegmentCache = new Map(); // text -> segments, oldest first
+let richSegmentCacheRegex = null;
+
 function renderTerminalRich(container, text) {
   // Light token highlighting to mimic hackmud coloring.
   // Keep it safe: create spans, don't inject HTML.
   text = applyEscalationTextEffects(String(text || ""));
   const nameRegex = getKnownNamesRegex();
+  // Segments only depend on the text and the known-names regex, and the same lines
+  // (help, errors, prompts) repeat constantly, so memoize them.
+  if (nameRegex !== richSegmentCacheRegex) {
+    richSegmentCache.clear();
+    richSegmentCacheRegex = nameRegex;
+  }
+  let segments = richSegmentCache.get(text);
+  if (segments) {
+    richSegmentCache.delete(text);
+  } else {
+    segments = richTextSegments(text, nameRegex);
+    if (richSegmentCache.size >= RICH_SEGMENT_CACHE_MAX) {
+      richSegmentCache.delete(richSegmentCache.keys().next().value);
+    }
+  }
+  richSegmentCache.set(text, segments);
+
+  container.textContent = "";
+  const frag = document.createDocumentFragment();
+  segments.forEach((s) => {
+    if (s.kind === "text") {
+      frag.appendChild(document.createTextNode(s.raw));
+      return;
+    }
+    const span = document.createElement("span");
+    span.className = s.cls;
+    span.textContent = s.raw;
+    frag.appendChild(span);
+  });
+  container.appendChild(frag);
+}
+
+function richTextSegments(text, nameRegex) {
   const patterns = [
     { re: /\bscripts\.trust(?:\.[a-zA-Z0-9_.]+)?\b/g, cls: "tok trust" },
     { re: /\b(FULLSEC|HIGHSEC|MIDSEC|LOWSEC|NULLSEC)\b/g, cls: "tok sec" },
@@ -2077,7 +2146,6 @@ function renderTerminalRich(container, text) {
     lastEnd = m.end;
   }
 
-  container.textContent = "";
   nonOverlapping.forEach((m) => {
     if (cursor < m.start) segments.push({ kind: "text", raw: text.slice(cursor, m.start) });
     if (m.file) {
@@ -2090,19 +2158,7 @@ function renderTerminalRich(container, text) {
     cursor = m.end;
   });
   if (cursor < text.length) segments.push({ kind: "text", raw: text.slice(cursor) });
-
-  const frag = document.createDocumentFragment();
-  segments.forEach((s) => {
-    if (s.kind === "text") {
-      frag.appendChild(document.createTextNode(s.raw));
-      return;
-    }
-    const span = document.createElement("span");
-    span.className = s.cls;
-    span.textContent = s.raw;
-    frag.appendChild(span);
-  });
-  container.appendChild(frag);
+  return segments;
 }
 
 function cooledSystemTone(body, from, kind) {
@@ -4686,16 +4742,27 @@ function getLoc(name) {
   return LOCS[name] || null;
 }
 
+const sortedSetCache = new WeakMap();
+function sortedSetValues(set) {
+  // For add-only Sets (discovered/inventory): a Set instance whose size is unchanged
+  // holds the same members, so the sorted snapshot can be reused until something is added.
+  const cached = sortedSetCache.get(set);
+  if (cached && cached.size === set.size) return cached.values.slice();
+  const values = Array.from(set).sort();
+  sortedSetCache.set(set, { size: set.size, values });
+  return values.slice();
+}
+
 function discover(locs) {
   const newly = [];
   locs.forEach((loc) => {
     RegionManager.noteDiscovery(loc);
+    // Scripts re-announce the same locs on every run; skip the region lookup for known ones.
+    if (state.discovered.has(loc)) return;
     const regionId = RegionManager.regionForNode(loc);
-    const regionLocked = regionId && !RegionManager.isRegionUnlocked(regionId);
-    if (!state.discovered.has(loc) && !regionLocked) {
-      state.discovered.add(loc);
-      newly.push(loc);
-    }
+    if (regionId && !RegionManager.isRegionUnlocked(regionId)) return;
+    state.discovered.add(loc);
+    newly.push(loc);
   });
   RegionManager.bootstrap({ silent: true });
   if (state.region && state.region.current && !state.currentRegion) {
@@ -4704,16 +4771,29 @@ function discover(locs) {
   return newly;
 }
 
+let locRequirementsCache = null;
+function getLocRequirements(locName) {
+  // LOCS is static, so normalize each loc's requirements once instead of on every scan/connect.
+  if (!locRequirementsCache) {
+    locRequirementsCache = new Map(); // locName -> { flags, items, trust }
+    Object.keys(LOCS).forEach((name) => {
+      const req = LOCS[name].requirements || {};
+      locRequirementsCache.set(name, {
+        flags: Array.isArray(req.flags) ? req.flags.map(String) : [],
+        items: Array.isArray(req.items) ? req.items.map(String) : [],
+        trust: Number(req.trust) || 0,
+      });
+    });
+  }
+  return locRequirementsCache.get(locName) || null;
+}
+
 function requirementsMet(locName) {
-  const loc = getLoc(locName);
-  if (!loc) return false;
-  const req = loc.requirements || {};
-  const flags = Array.isArray(req.flags) ? req.flags : [];
-  const items = Array.isArray(req.items) ? req.items : [];
-  const okFlags = flags.every((f) => state.flags.has(String(f)));
-  const okItems = items.every((i) => state.inventory.has(String(i)));
-  const needTrust = Number(req.trust) || 0;
-  const okTrust = !needTrust || trustGate(needTrust);
+  const req = getLocRequirements(locName);
+  if (!req) return false;
+  const okFlags = req.flags.every((f) => state.flags.has(f));
+  const okItems = req.items.every((i) => state.inventory.has(i));
+  const okTrust = !req.trust || trustGate(req.trust);
   return okFlags && okItems && okTrust;
 }
 
@@ -4732,18 +4812,16 @@ function listMarks() {
 function listLocs() {
   writeLine("LOCATIONS", "header");
   RegionManager.bootstrap({ silent: true });
-  Array.from(state.discovered)
-    .sort()
-    .forEach((locName) => {
-      if (!RegionManager.isNodeVisible(locName)) return;
-      const node = getLoc(locName);
-      const title = node ? node.title : "UNKNOWN";
-      const reqOk = requirementsMet(locName);
-      const noLocks = !!(node && Array.isArray(node.locks) && node.locks.length === 0);
-      const unlocked = state.unlocked.has(locName) || noLocks;
-      const openNow = reqOk && unlocked;
-      writeLine(`${locName} [${openNow ? "open" : "locked"}] :: ${title}`, "dim");
-    });
+  sortedSetValues(state.discovered).forEach((locName) => {
+    if (!RegionManager.isNodeVisible(locName)) return;
+    const node = getLoc(locName);
+    const title = node ? node.title : "UNKNOWN";
+    const reqOk = requirementsMet(locName);
+    const noLocks = !!(node && Array.isArray(node.locks) && node.locks.length === 0);
+    const unlocked = state.unlocked.has(locName) || noLocks;
+    const openNow = reqOk && unlocked;
+    writeLine(`${locName} [${openNow ? "open" : "locked"}] :: ${title}`, "dim");
+  });
 }
 
 function showLoc() {
@@ -4753,7 +4831,7 @@ function showLoc() {
     return;
   }
   writeLine(`:: ${state.loc} :: ${loc.title}`, "header");
-  writeBlock(loc.desc.join("\n"), "dim");
+  writeBlock(loc.desc, "dim");
   trackRecentLoc(state.loc);
 }
 
@@ -5914,7 +5992,7 @@ function readFile(name) {
     }
   }
 
-  writeBlock(entry.content, "dim");
+  writeBlock(staticBlockLines(entry), "dim");
   if (String(name || "").toLowerCase() === "primer.dat") state.flags.add("read_primer");
   if (String(name || "").toLowerCase() === "script.intro") state.flags.add("read_script_intro");
   handleLoreSignals(state.loc, found.name, entry);
@@ -6824,7 +6902,7 @@ function listInventory() {
     return;
   }
   if (state.inventory.size) {
-    writeLine("Items: " + Array.from(state.inventory).sort().join(", "), "dim");
+    writeLine("Items: " + sortedSetValues(state.inventory).join(", "), "dim");
   }
   if (state.upgrades && state.upgrades.size) {
     writeLine("Installed: " + Array.from(state.upgrades).sort().join(", "), "dim");
@@ -6961,6 +7039,35 @@ function profiledTraceRise(base, reason) {
   return delta;
 }
 
+const ROT13_TABLE = (() => {
+  const table = {};
+  const upper = "ABCDEFGHIJKLMNOPQRSTUVWXYZ";
+  const lower = upper.toLowerCase();
+  for (let i = 0; i < 26; i++) {
+    table[upper[i]] = upper[(i + 13) % 26];
+    table[lower[i]] = lower[(i + 13) % 26];
+  }
+  return table;
+})();
+
+// Decoded phrase -> flags it sets. Fragment clues are folded in from GLITCH_FRAGMENTS.
+const DECODE_PHRASE_FLAGS = (() => {
+  const map = new Map([
+    ["EMBER", ["ember_phrase"]],
+    ["LATTICE", ["lattice_sigil"]],
+    ["SLIPPER", ["slipper_signal"]],
+    ["ROGUE", ["rogue_hint"]],
+    ["ADAPT", ["rogue_hint"]],
+    ["MANTLE", ["mantle_phrase"]],
+  ]);
+  Object.values(GLITCH_FRAGMENTS).forEach((frag) => {
+    map.set(frag.clue, [...(map.get(frag.clue) || []), frag.flag]);
+  });
+  return map;
+})();
+// Zero-width lookahead so overlapping phrases (e.g. MANTLEMBER) all match, like separate includes() checks.
+const DECODE_PHRASE_RE = new RegExp(`(?=(${Array.from(DECODE_PHRASE_FLAGS.keys()).join("|")}))`, "g");
+
 function decodeCipher(type, payload) {
   const data = payload || state.lastCipher;
   if (!data) {
@@ -6969,10 +7076,7 @@ function decodeCipher(type, payload) {
   }
   let output = "";
   if (type === "rot13") {
-    output = data.replace(/[a-zA-Z]/g, (c) => {
-      const base = c <= "Z" ? 65 : 97;
-      return String.fromCharCode(((c.charCodeAt(0) - base + 13) % 26) + base);
-    });
+    output = data.replace(/[a-zA-Z]/g, (c) => ROT13_TABLE[c]);
   } else if (type === "b64") {
     try {
       output = atob(data);
@@ -6987,20 +7091,15 @@ function decodeCipher(type, payload) {
   writeLine("Decoded:", "header");
   writeBlock(output, "ok");
   const upper = output.toUpperCase();
-  if (upper.includes("EMBER")) state.flags.add("ember_phrase");
-  if (upper.includes("LATTICE")) state.flags.add("lattice_sigil");
-  if (upper.includes("SLIPPER")) state.flags.add("slipper_signal");
-  Object.values(GLITCH_FRAGMENTS).forEach((frag) => {
-    if (upper.includes(frag.clue)) state.flags.add(`fragment_${frag.id}`);
-  });
-  if (upper.includes("ROGUE") || upper.includes("ADAPT")) state.flags.add("rogue_hint");
-  if (upper.includes("MANTLE")) state.flags.add("mantle_phrase");
+  for (const m of upper.matchAll(DECODE_PHRASE_RE)) {
+    DECODE_PHRASE_FLAGS.get(m[1]).forEach((flag) => state.flags.add(flag));
+  }
   validateGlitchChant();
   storyChatTick();
 }
 
 function recordFragment(id) {
-  const key = `fragment_${id}`;
+  const key = GLITCH_FRAGMENTS[id] ? GLITCH_FRAGMENTS[id].flag : `fragment_${id}`;
   state.flags.add(key);
   if (state.storyState && state.storyState.beats) {
     state.storyState.beats.add(key);
@@ -7162,7 +7261,7 @@ function storyProgressEvent(kind, payload) {
 
 function fragmentTextToWord(text) {
   return String(text || "")
-    .replace(new RegExp(GLITCH_GLYPH, "g"), "")
+    .replace(GLITCH_GLYPH_RE, "")
     .replace(/[^A-Z]/gi, "")
     .toUpperCase();
 }
@@ -7172,7 +7271,7 @@ function softenFragmentCorruption(text) {
   const clarity = corruptionLevel() + (trustLevel() <= 2 ? 1 : 0);
   if (clarity <= 0) return text;
   const ratio = Math.min(0.6, clarity * 0.15);
-  return String(text || "").replace(new RegExp(GLITCH_GLYPH, "g"), (m) => (Math.random() < ratio ? "" : m));
+  return String(text || "").replace(GLITCH_GLYPH_RE, (m) => (Math.random() < ratio ? "" : m));
 }
 
 function glitchFragmentsFromDrive() {
@@ -7923,11 +8022,10 @@ function listScripts() {
 }
 
 function canAttemptLoc(locName) {
-  const loc = getLoc(locName);
-  const req = (loc && loc.requirements) || {};
-  const missingItems = (req.items || []).filter((item) => !state.inventory.has(item));
-  const missingFlags = (req.flags || []).filter((flag) => !state.flags.has(flag));
-  const trustNeed = Number(req.trust) || 0;
+  const req = getLocRequirements(locName) || { flags: [], items: [], trust: 0 };
+  const missingItems = req.items.filter((item) => !state.inventory.has(item));
+  const missingFlags = req.flags.filter((flag) => !state.flags.has(flag));
+  const trustNeed = req.trust;
   const missingTrust = trustNeed && !trustGate(trustNeed) ? trustNeed : null;
   return { ok: !missingItems.length && !missingFlags.length && !missingTrust, missingItems, missingFlags, missingTrust };
 }
@@ -8300,12 +8398,26 @@ function getLocFileEntry(locName, fileName) {
   if (loc.files[key]) return { name: key, entry: loc.files[key] };
 
   // Case-insensitive fallback (helps with user scripts that reference older casing).
-  const lower = key.toLowerCase();
-  const found = Object.keys(loc.files).find((k) => k.toLowerCase() === lower);
+  const found = getLocFileNameIndex(locName).get(key.toLowerCase());
   if (!found) return null;
   return { name: found, entry: loc.files[found] };
 }
 
+let locFileNameIndexCache = null;
+function getLocFileNameIndex(locName) {
+  if (!locFileNameIndexCache) locFileNameIndexCache = new Map(); // locName -> Map(lowerName -> fileName)
+  let index = locFileNameIndexCache.get(locName);
+  if (index) return index;
+  index = new Map();
+  const loc = getLoc(locName);
+  Object.keys((loc && loc.files) || {}).forEach((k) => {
+    const lower = k.toLowerCase();
+    if (!index.has(lower)) index.set(lower, k);
+  });
+  locFileNameIndexCache.set(locName, index);
+  return index;
+}
+
 function getLocFileText(locName, fileName) {
   const found = getLocFileEntry(locName, fileName);
   if (!found) return null;
@@ -8509,6 +8621,7 @@ function saveState(options) {
 function loadState(options) {
   const opts = options || {};
   let raw = localStorage.getItem(SAVE_KEY);
+  const fromLegacy = !raw;
   if (!raw) raw = localStorage.getItem(LEGACY_SAVE_KEY);
   if (!raw) {
     if (!opts.silent) writeLine("No save found.", "warn");
@@ -8704,7 +8817,8 @@ function loadState(options) {
   void refreshLocalFolderUi();
   void backfillLocalFolderFromDrive({ silent: true, prompt: false });
   // If we loaded from legacy key, persist in the new namespace.
-  if (localStorage.getItem(SAVE_KEY) === null) localStorage.setItem(SAVE_KEY, JSON.stringify(JSON.parse(raw)));
+  // `raw` already parsed cleanly above, so store it as-is instead of re-encoding.
+  if (fromLegacy && localStorage.getItem(SAVE_KEY) === null) localStorage.setItem(SAVE_KEY, raw);
   saveDirty = false;
   return true;
 }
@@ -8846,7 +8960,7 @@ function diagnoseProgress() {
   } else {
     writeLine("All regions open.", "dim");
   }
-  const discovered = Array.from(state.discovered).sort();
+  const discovered = sortedSetValues(state.discovered);
   const locked = discovered.filter((l) => !state.unlocked.has(l));
   if (!locked.length) {
     writeLine("No discovered locs are locked.", "dim");
@@ -9281,12 +9395,6 @@ function handleCommand(inputText) {
     case "regions":
       RegionManager.describeRegions();
       break;
-    case "store":
-      listStore();
-      break;
-    case "buy":
-      buyItem(args[0]);
-      break;
     case "siphon":
       siphonCommand(args);
       break;
@@ -9326,9 +9434,6 @@ function handleCommand(inputText) {
     case "install":
       installUpgrade(args[0]);
       break;
-    case "siphon":
-      siphonCommand(args);
-      break;
     case "ping":
       pingCommand(args);
       break;
@@ -9491,7 +9596,7 @@ function handleCommand(inputText) {
 
   if (!NON_DIRTY_COMMANDS.has(cmd)) markDirty();
   ensureAutosaveLoop();
-  autoSaveNow();
+  autoSaveWhenIdle();
   tutorialAdvance();
   updateHud();
 }
@@ -9686,7 +9791,7 @@ function allScriptNames() {
 }
 
 function allLocNames() {
-  return uniqueSorted(Array.from(state.discovered));
+  return sortedSetValues(state.discovered);
 }
 
 function allFileNames() {
@@ -9710,7 +9815,7 @@ function allUploadSourceRefs() {
 }
 
 function allUpgradeNames() {
-  return uniqueSorted(Array.from(state.inventory).filter((i) => i.startsWith("upg.")));
+  return sortedSetValues(state.inventory).filter((i) => i.startsWith("upg."));
 }
 
 function allCommandNames() {